@@ -1,12 +1,231 @@
 import os
 import re
+import shutil
+import subprocess
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import numpy as np
 import folder_paths # type: ignore
-from moviepy.editor import VideoFileClip, concatenate_videoclips
+
+# moviepy.editor drags in PIL, imageio and friends; it is only needed
+# for the merger's fallback path, so it is imported inside that
+# function to keep ComfyUI startup lean
 
 Segment = namedtuple("Segment", ["path", "start", "end"])
 
+# Compiled once: matched per file when probing durations without ffprobe
+_DURATION_RE = re.compile(r"Duration:\s*(\d+):(\d+):(\d+\.?\d*)")
+
+def _ffmpeg_exe():
+    """Locate the ffmpeg binary, falling back to the one bundled with moviepy"""
+    exe = shutil.which("ffmpeg")
+    if exe:
+        return exe
+    from imageio_ffmpeg import get_ffmpeg_exe  # installed with moviepy
+    return get_ffmpeg_exe()
+
+def _probe_duration(video_path):
+    """Read a video's duration in seconds without opening a decoder"""
+    ffprobe = shutil.which("ffprobe")
+    if ffprobe:
+        out = subprocess.check_output([
+            ffprobe, "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=nw=1:nk=1",
+            video_path
+        ])
+        return float(out)
+    # No ffprobe available: parse the "Duration:" line from ffmpeg itself
+    result = subprocess.run(
+        [_ffmpeg_exe(), "-i", video_path],
+        capture_output=True, text=True
+    )
+    match = _DURATION_RE.search(result.stderr)
+    if not match:
+        raise ValueError(f"Could not determine duration of: {video_path}")
+    hours, minutes, seconds = match.groups()
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
+_ENCODER_CACHE = None
+
+def _available_encoders():
+    """Names of the encoders the ffmpeg binary supports, probed once"""
+    global _ENCODER_CACHE
+    if _ENCODER_CACHE is None:
+        encoders = set()
+        try:
+            result = subprocess.run(
+                [_ffmpeg_exe(), "-hide_banner", "-encoders"],
+                capture_output=True, text=True
+            )
+            for line in result.stdout.splitlines():
+                parts = line.split()
+                # Encoder rows look like " V....D libx264  H.264 ..."
+                if len(parts) >= 2 and parts[0][0] in "VA" and parts[1] != "=":
+                    encoders.add(parts[1])
+        except OSError:
+            pass
+        _ENCODER_CACHE = encoders
+    return _ENCODER_CACHE
+
+def _has_audio(video_path):
+    """Whether the file carries an audio stream"""
+    result = subprocess.run(
+        [_ffmpeg_exe(), "-i", video_path],
+        capture_output=True, text=True
+    )
+    return " Audio:" in result.stderr
+
+def _pool_workers():
+    """Worker count for segment pools: half the cores, at least one"""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+class VideoEncodingSettings:
+    """
+    Shared encoding options for the splitter and merger nodes
+    """
+
+    VALID_VIDEO_CODECS = [
+        "libx264", "hevc",
+        "h264_nvenc", "hevc_nvenc",  # NVIDIA
+        "h264_videotoolbox",         # macOS
+        "h264_qsv",                  # Intel Quick Sync
+    ]
+    HARDWARE_VIDEO_CODECS = {
+        "h264_nvenc", "hevc_nvenc", "h264_videotoolbox", "h264_qsv"
+    }
+    VALID_AUDIO_CODECS = ["aac", "libmp3lame", "copy"]
+    VALID_PRESETS = [
+        "ultrafast", "superfast", "veryfast", "faster", "fast",
+        "medium", "slow", "slower", "veryslow"
+    ]
+    # NVENC uses its own p1 (fastest) .. p7 (slowest) preset vocabulary
+    NVENC_PRESETS = {
+        "ultrafast": "p1",
+        "superfast": "p1",
+        "veryfast": "p2",
+        "faster": "p3",
+        "fast": "p3",
+        "medium": "p4",
+        "slow": "p5",
+        "slower": "p6",
+        "veryslow": "p7",
+    }
+
+    @classmethod
+    def input_types(cls):
+        """The encoding entries shared by both nodes' optional INPUT_TYPES"""
+        return {
+            "video_codec": (cls.VALID_VIDEO_CODECS, {
+                "default": "libx264"
+            }),
+            "video_bitrate": ("STRING", {
+                "default": "8000k",
+                "multiline": False
+            }),
+            "audio_codec": (cls.VALID_AUDIO_CODECS, {
+                "default": "aac"
+            }),
+            "audio_bitrate": ("STRING", {
+                "default": "192k",
+                "multiline": False
+            }),
+            "preset": (cls.VALID_PRESETS, {
+                "default": "medium"
+            }),
+        }
+
+    @classmethod
+    def get_encoding_params(cls, video_codec, video_bitrate, audio_codec,
+                            audio_bitrate, preset, threads=4,
+                            intermediate=False):
+        """Build encoding params, mapping presets and falling back to
+        libx264 when a hardware encoder is not available. Intermediate
+        outputs trade a few percent of bitrate for cheaper decoding when
+        the merger re-reads them; final outputs get a relocated MOOV
+        atom for instant playback"""
+        if (video_codec in cls.HARDWARE_VIDEO_CODECS
+                and video_codec not in _available_encoders()):
+            print(f"Encoder {video_codec} not available, falling back to libx264")
+            video_codec = "libx264"
+
+        params = {
+            "codec": video_codec,
+            "bitrate": video_bitrate,
+            "audio_codec": audio_codec,
+            "audio_bitrate": audio_bitrate,
+        }
+        if video_codec in cls.HARDWARE_VIDEO_CODECS:
+            # Hardware encoders do their own scheduling ("Threading
+            # capabilities: none"), so no threads kwarg
+            if video_codec.endswith("_nvenc"):
+                params["preset"] = cls.NVENC_PRESETS[preset]
+            elif video_codec == "h264_qsv":
+                # Quick Sync understands the x264 preset names
+                params["preset"] = preset
+        else:
+            params["preset"] = preset
+            params["threads"] = threads
+
+        if intermediate:
+            if video_codec in ("libx264", "hevc"):
+                # fastdecode turns off CABAC and the loop filter
+                params["ffmpeg_params"] = ["-tune", "fastdecode"]
+        else:
+            params["ffmpeg_params"] = ["-movflags", "+faststart"]
+        return params
+
+    @classmethod
+    def video_args(cls, params):
+        """Translate encoding params into ffmpeg CLI video options"""
+        args = ["-c:v", params["codec"], "-b:v", params["bitrate"]]
+        if "preset" in params:
+            args += ["-preset", params["preset"]]
+        if "threads" in params:
+            args += ["-threads", str(params["threads"])]
+        args += params.get("ffmpeg_params", [])
+        return args
+
+    @classmethod
+    def audio_args(cls, params):
+        """Translate encoding params into ffmpeg CLI audio options"""
+        if params["audio_codec"] == "copy":
+            return ["-c:a", "copy"]
+        return ["-c:a", params["audio_codec"], "-b:a", params["audio_bitrate"]]
+
+def _run_ffmpeg(cmd, context):
+    """Run an ffmpeg command, raising its last stderr line on failure"""
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        error = result.stderr.strip().splitlines()[-1:] or ["unknown error"]
+        raise RuntimeError(f"ffmpeg failed on {context}: {error[0]}")
+
+def _copy_segment(ffmpeg, video_path, start, end, output_path):
+    """Stream-copy one segment; runs in a worker process"""
+    _run_ffmpeg(
+        [
+            ffmpeg, "-y",
+            "-ss", str(start), "-to", str(end),
+            "-i", video_path,
+            "-c", "copy",
+            "-avoid_negative_ts", "make_zero",
+            output_path
+        ],
+        os.path.basename(output_path)
+    )
+    return output_path
+
+def _encode_segment(ffmpeg, video_path, start, end, output_path, encoding_params):
+    """Re-encode one segment; runs in a worker process. -ss before -i
+    fast-seeks via the index instead of decoding from the start of the
+    file, so cost does not grow with the segment's position"""
+    cmd = [ffmpeg, "-y", "-ss", str(start), "-i", video_path, "-t", str(end - start)]
+    cmd += VideoEncodingSettings.video_args(encoding_params)
+    cmd += VideoEncodingSettings.audio_args(encoding_params)
+    cmd.append(output_path)
+    _run_ffmpeg(cmd, os.path.basename(output_path))
+    return output_path
+
 class VideoSplitterNode:
     """
     ComfyUI node for splitting videos into overlapping segments with progress reporting
@@ -34,34 +253,21 @@ class VideoSplitterNode:
                 }),
             },
             "optional": {
-                "video_codec": (["libx264", "hevc"], {
-                    "default": "libx264"
-                }),
-                "video_bitrate": ("STRING", {
-                    "default": "8000k",
-                    "multiline": False
-                }),
-                "audio_codec": (["aac", "libmp3lame", "copy"], {
-                    "default": "aac"
-                }),
-                "audio_bitrate": ("STRING", {
-                    "default": "192k",
-                    "multiline": False
-                }),
-                "preset": (["ultrafast", "superfast", "veryfast", "faster", "fast", "medium", "slow", "slower", "veryslow"], {
-                    "default": "medium"
+                **VideoEncodingSettings.input_types(),
+                "reencode": ("BOOLEAN", {
+                    "default": False
                 }),
             }
         }
-    
+
     RETURN_TYPES = ("STRING",)
     FUNCTION = "split_video"
     CATEGORY = "video"
 
-    def split_video(self, video_path, segment_length=10.0, overlap=2.0, 
+    def split_video(self, video_path, segment_length=10.0, overlap=2.0,
                    video_codec="libx264", video_bitrate="8000k",
-                   audio_codec="aac", audio_bitrate="192k", 
-                   preset="medium"):
+                   audio_codec="aac", audio_bitrate="192k",
+                   preset="medium", reencode=False):
         # Validate video path
         if not os.path.exists(video_path):
             raise ValueError(f"Video file not found: {video_path}")
@@ -72,43 +278,67 @@ class VideoSplitterNode:
             os.makedirs(output_dir)
 
         print(f"Loading video: {video_path}")
-        video = VideoFileClip(video_path)
-        duration = video.duration
+        duration = _probe_duration(video_path)
+        ffmpeg = _ffmpeg_exe()
         step = segment_length - overlap
-        start_times = list(range(0, int(duration), int(step)))
-        total_segments = len(start_times)
+        if step <= 0:
+            raise ValueError("overlap must be smaller than segment_length")
 
-        print(f"Splitting video into {total_segments} segments...")
-        for i, start in enumerate(start_times):
-            # Report progress
-            progress = (i / total_segments) * 100
-            print(f"Processing segment {i+1}/{total_segments} ({progress:.1f}%)")
-
-            end = min(start + segment_length, duration)
-            if end - start < 3:
-                continue
-
-            segment = video.subclip(start, end)
-            filename = os.path.splitext(os.path.basename(video_path))[0]
-            output_path = os.path.join(
-                output_dir,
-                f"{filename}_segment_{i:03d}_{start:05.1f}-{end:05.1f}.mp4"
-            )
+        # Compute float-accurate boundaries in one vectorized pass; the
+        # int() truncation used previously silently dropped fractional
+        # steps and shifted segment starts
+        start_times = np.arange(0.0, duration, step)
+        ends = np.minimum(start_times + segment_length, duration)
+        keep = (ends - start_times) >= 3
+        start_times, ends = start_times[keep], ends[keep]
 
-            # Write segment with specified encoding parameters
-            segment.write_videofile(
-                output_path,
-                codec=video_codec,
-                bitrate=video_bitrate,
-                audio_codec=audio_codec,
-                audio_bitrate=audio_bitrate,
-                preset=preset,
-                threads=4,
-                logger=None  # Suppress moviepy's internal progress bars
+        # Collect the segment jobs, then encode them in parallel: each
+        # segment is independent, so a pool of single-purpose ffmpeg
+        # children beats one encoder on a handful of threads.
+        # Braces in the source filename must stay literal in the template
+        filename = os.path.splitext(os.path.basename(video_path))[0]
+        filename = filename.replace("{", "{{").replace("}", "}}")
+        output_template = os.path.join(
+            output_dir, filename + "_segment_{:03d}_{:05.1f}-{:05.1f}.mp4"
+        )
+        jobs = [
+            (start, end, output_template.format(i, start, end))
+            for i, (start, end) in enumerate(zip(start_times, ends))
+        ]
+
+        total_segments = len(jobs)
+        print(f"Splitting video into {total_segments} segments...")
+        if reencode:
+            # threads=2 per child: the pool already fills the cores
+            encoding_params = VideoEncodingSettings.get_encoding_params(
+                video_codec, video_bitrate, audio_codec, audio_bitrate,
+                preset, threads=2, intermediate=True
             )
-            segment.close()
+        with ProcessPoolExecutor(max_workers=_pool_workers()) as executor:
+            if reencode:
+                futures = [
+                    executor.submit(_encode_segment, ffmpeg, video_path,
+                                    start, end, output_path, encoding_params)
+                    for start, end, output_path in jobs
+                ]
+            else:
+                # Stream-copy the segments without decoding or re-encoding.
+                # Cuts snap to the nearest prior keyframe, so boundaries may
+                # drift slightly earlier; enable reencode for exact cuts.
+                futures = [
+                    executor.submit(_copy_segment, ffmpeg, video_path, start,
+                                    end, output_path)
+                    for start, end, output_path in jobs
+                ]
+            for i, future in enumerate(as_completed(futures)):
+                try:
+                    future.result()
+                except Exception:
+                    # Fail fast instead of finishing the queued segments
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+                print(f"Processed segment {i+1}/{total_segments} ({((i+1)/total_segments)*100:.1f}%)")
 
-        video.close()
         print("Video splitting completed!")
         return (output_dir,)
 
@@ -127,29 +357,13 @@ class VideoMergerNode:
                 }),
                 "fade_duration": ("FLOAT", {
                     "default": 2.0,
-                    "min": 0.5,
+                    "min": 0.0,
                     "max": 5.0,
                     "step": 0.5
                 }),
             },
             "optional": {
-                "video_codec": (["libx264", "hevc"], {
-                    "default": "libx264"
-                }),
-                "video_bitrate": ("STRING", {
-                    "default": "8000k",
-                    "multiline": False
-                }),
-                "audio_codec": (["aac", "libmp3lame", "copy"], {
-                    "default": "aac"
-                }),
-                "audio_bitrate": ("STRING", {
-                    "default": "192k",
-                    "multiline": False
-                }),
-                "preset": (["ultrafast", "superfast", "veryfast", "faster", "fast", "medium", "slow", "slower", "veryslow"], {
-                    "default": "medium"
-                }),
+                **VideoEncodingSettings.input_types(),
             }
         }
     
@@ -157,22 +371,16 @@ class VideoMergerNode:
     FUNCTION = "merge_videos"
     CATEGORY = "video"
 
-    def create_opacity_mask(self, clip, fade_in=False, fade_out=False, fade_duration=2.0):
-        def make_frame(t):
-            mask = np.ones((clip.h, clip.w))
-            if fade_in and t < fade_duration:
-                mask = mask * (t / fade_duration)
-            elif fade_out and t > (clip.duration - fade_duration):
-                mask = mask * ((clip.duration - t) / fade_duration)
-            return mask
-
-        return clip.set_mask(clip.to_mask().fl(lambda gf, t: make_frame(t)))
-
     def extract_time_info(self, filename):
-        match = re.search(r"_(\d+\.\d+)-(\d+\.\d+)\.mp4$", filename)
-        if match:
-            return float(match.group(1)), float(match.group(2))
-        return None, None
+        # Filenames end in _<start>-<end>.mp4; plain string splitting is
+        # cheaper than running the regex engine per segment file
+        stem = filename[:-4] if filename.endswith(".mp4") else filename
+        try:
+            _, times = stem.rsplit("_", 1)
+            start, end = times.split("-", 1)
+            return float(start), float(end)
+        except ValueError:
+            return None, None
 
     def merge_videos(self, segments_dir, fade_duration=2.0,
                     video_codec="libx264", video_bitrate="8000k",
@@ -181,55 +389,196 @@ class VideoMergerNode:
         if not os.path.exists(segments_dir):
             raise ValueError(f"Segments directory not found: {segments_dir}")
 
-        # Get and sort segments
+        # Get and sort segments; one scandir pass also yields the file
+        # type, so directories named *.mp4 are skipped without extra
+        # stat calls
         print("Analyzing video segments...")
-        files = [f for f in os.listdir(segments_dir) if f.endswith(".mp4")]
-        segments = []
+        with os.scandir(segments_dir) as entries:
+            files = [e.name for e in entries
+                     if e.name.endswith(".mp4") and e.is_file()]
+        paths, starts, ends = [], [], []
         for file in files:
             start, end = self.extract_time_info(file)
             if start is not None and end is not None:
-                segments.append(
-                    Segment(path=os.path.join(segments_dir, file), start=start, end=end)
-                )
-        
-        segments.sort(key=lambda x: x.start)
-        
-        if not segments:
+                paths.append(os.path.join(segments_dir, file))
+                starts.append(start)
+                ends.append(end)
+
+        if not paths:
             raise ValueError("No valid video segments found")
 
-        # Load and process clips
-        clips = []
+        # Parallel arrays ordered by start time with one C-level argsort
+        order = np.argsort(np.asarray(starts), kind="stable")
+        segments = [
+            Segment(path=paths[i], start=starts[i], end=ends[i])
+            for i in order
+        ]
+
+        print(f"Found {len(segments)} segments to merge")
+        output_file = os.path.join(folder_paths.get_output_directory(), "merged_video.mp4")
+
+        # Without a fade the merge is pure concatenation, so stream-copy
+        # the packets instead of decoding and re-encoding anything. The
+        # xfade graph cannot express a zero-length transition, so on
+        # failure go straight to the moviepy pipeline.
+        if fade_duration <= 0:
+            try:
+                self._merge_with_concat(segments, output_file)
+            except (RuntimeError, OSError) as error:
+                print(f"ffmpeg concat failed ({error}), falling back to moviepy")
+                self._merge_with_moviepy(segments, fade_duration, video_codec,
+                                         video_bitrate, audio_codec,
+                                         audio_bitrate, preset, output_file)
+            print("Video merging completed!")
+            return (output_file,)
+
+        # Merge in a single ffmpeg process: compositing and fades run in
+        # ffmpeg's filter graph instead of per-frame Python/NumPy. The
+        # moviepy pipeline stays as a fallback for inputs the filter
+        # graph rejects (e.g. segments with mismatched parameters).
+        try:
+            self._merge_with_ffmpeg(segments, fade_duration, video_codec,
+                                    video_bitrate, audio_codec, audio_bitrate,
+                                    preset, output_file)
+        except (RuntimeError, OSError) as error:
+            print(f"ffmpeg merge failed ({error}), falling back to moviepy")
+            self._merge_with_moviepy(segments, fade_duration, video_codec,
+                                     video_bitrate, audio_codec, audio_bitrate,
+                                     preset, output_file)
+
+        print("Video merging completed!")
+        return (output_file,)
+
+    def _merge_with_concat(self, segments, output_file):
+        """Concatenate segments without re-encoding via the concat demuxer.
+        Requires matching codec parameters, which splitter output has"""
+        list_path = output_file + ".segments.txt"
+        with open(list_path, "w") as handle:
+            for segment in segments:
+                # concat-demuxer quoting: ' closes, \' escapes, ' reopens
+                path = os.path.abspath(segment.path).replace("'", "'\\''")
+                handle.write(f"file '{path}'\n")
+
+        print("Concatenating with stream copy...")
+        try:
+            _run_ffmpeg(
+                [
+                    _ffmpeg_exe(), "-y",
+                    "-f", "concat", "-safe", "0",
+                    "-i", list_path,
+                    "-c", "copy",
+                    "-movflags", "+faststart",
+                    output_file
+                ],
+                "concat"
+            )
+        finally:
+            os.remove(list_path)
+
+    def _merge_with_ffmpeg(self, segments, fade_duration, video_codec,
+                           video_bitrate, audio_codec, audio_bitrate,
+                           preset, output_file):
+        ffmpeg = _ffmpeg_exe()
+
+        if len(segments) == 1:
+            _run_ffmpeg(
+                [ffmpeg, "-y", "-i", segments[0].path, "-c", "copy",
+                 "-movflags", "+faststart", output_file],
+                os.path.basename(segments[0].path)
+            )
+            return
+
+        print("Probing segment durations...")
+        paths = [s.path for s in segments]
+        with ThreadPoolExecutor(max_workers=_pool_workers()) as executor:
+            durations = list(executor.map(_probe_duration, paths))
+            # Any segment with audio gets the acrossfade chain; a dir
+            # mixing silent and audible segments then errors into the
+            # moviepy fallback, which composites such audio correctly
+            has_audio = any(executor.map(_has_audio, paths))
+
+        params = VideoEncodingSettings.get_encoding_params(
+            video_codec, video_bitrate, audio_codec, audio_bitrate, preset
+        )
+
+        # Chain xfade (and acrossfade for audio) between consecutive
+        # inputs; each transition starts fade_duration before the end of
+        # the accumulated stream, so the offsets are one cumulative sum
+        offsets = np.cumsum(np.asarray(durations[:-1]) - fade_duration)
+
+        filters = []
+        video_in, audio_in = "[0:v]", "[0:a]"
+        for i in range(1, len(segments)):
+            video_out, audio_out = f"[v{i}]", f"[a{i}]"
+            filters.append(
+                f"{video_in}[{i}:v]xfade=transition=fade"
+                f":duration={fade_duration}:offset={offsets[i-1]:.3f}{video_out}"
+            )
+            if has_audio:
+                filters.append(
+                    f"{audio_in}[{i}:a]acrossfade=d={fade_duration}{audio_out}"
+                )
+            video_in, audio_in = video_out, audio_out
+
+        cmd = [ffmpeg, "-y"]
+        for segment in segments:
+            cmd += ["-i", segment.path]
+        cmd += ["-filter_complex", ";".join(filters), "-map", video_in]
+        cmd += VideoEncodingSettings.video_args(params)
+        if has_audio:
+            # The crossfaded audio is a new stream, so "copy" cannot apply
+            if params["audio_codec"] == "copy":
+                params = dict(params, audio_codec="aac")
+            cmd += ["-map", audio_in] + VideoEncodingSettings.audio_args(params)
+        cmd.append(output_file)
+
+        print("Merging with ffmpeg xfade...")
+        _run_ffmpeg(cmd, "xfade merge")
+
+    def _merge_with_moviepy(self, segments, fade_duration, video_codec,
+                            video_bitrate, audio_codec, audio_bitrate,
+                            preset, output_file):
+        from moviepy.editor import VideoFileClip, concatenate_videoclips
+
+        # Load clips in parallel, then process them in order. Clips have to
+        # live in this process, so a thread pool does the preloading while
+        # each thread's ffmpeg child parses headers independently.
         total_segments = len(segments)
-        print(f"Found {total_segments} segments to merge")
-        
-        for i, segment in enumerate(segments):
-            # Report loading progress
-            print(f"Loading segment {i+1}/{total_segments} ({(i/total_segments)*100:.1f}%)")
-            clip = VideoFileClip(segment.path)
-            
-            if i > 0:
-                clip = self.create_opacity_mask(clip, fade_in=True, fade_duration=fade_duration)
-            if i < total_segments - 1:
-                clip = self.create_opacity_mask(clip, fade_out=True, fade_duration=fade_duration)
-            
+        print(f"Loading {total_segments} segments...")
+        with ThreadPoolExecutor(max_workers=_pool_workers()) as executor:
+            loaded = list(executor.map(lambda s: VideoFileClip(s.path), segments))
+
+        # Built-in crossfades ramp the mask without calling back into
+        # Python for every rendered frame
+        clips = []
+        for i, clip in enumerate(loaded):
+            if fade_duration > 0:
+                if i > 0:
+                    clip = clip.crossfadein(fade_duration)
+                if i < total_segments - 1:
+                    clip = clip.crossfadeout(fade_duration)
+
             clips.append(clip)
 
         print("Concatenating clips...")
-        final_clip = concatenate_videoclips(clips, method="compose", padding=-fade_duration)
-        
-        # Generate output path
-        output_file = os.path.join(folder_paths.get_output_directory(), "merged_video.mp4")
-        
+        if fade_duration > 0:
+            final_clip = concatenate_videoclips(clips, method="compose",
+                                                padding=-fade_duration)
+        elif len({tuple(clip.size) for clip in clips}) == 1:
+            # No overlap to composite and matching dimensions: chain mode
+            # streams frames straight through instead of alpha-blending
+            # every output frame in CompositeVideoClip
+            final_clip = concatenate_videoclips(clips, method="chain")
+        else:
+            final_clip = concatenate_videoclips(clips, method="compose")
+
         print("Writing final video...")
         final_clip.write_videofile(
             output_file,
-            codec=video_codec,
-            bitrate=video_bitrate,
-            audio_codec=audio_codec,
-            audio_bitrate=audio_bitrate,
-            preset=preset,
-            threads=4,
-            logger=None
+            logger=None,
+            **VideoEncodingSettings.get_encoding_params(
+                video_codec, video_bitrate, audio_codec, audio_bitrate, preset
+            )
         )
 
         # Clean up
@@ -237,9 +586,6 @@ class VideoMergerNode:
         for clip in clips:
             clip.close()
         final_clip.close()
-        
-        print("Video merging completed!")
-        return (output_file,)
 
 # Register nodes
 NODE_CLASS_MAPPINGS = {